@@ -1,10 +1,420 @@
-from collections import defaultdict
-from pyvis import network as net
-from IPython.display import display, HTML
-import plotly.graph_objects as go
-import random
-import minify_html
-from typing import List, Tuple, Union
+from collections import deque
+from itertools import chain
+import operator
+import warnings
+import numpy as np
+from numba import njit, prange
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+
+# A partir deste número de vértices, bfs, dfs e has_cycle passam a usar os kernels compilados sobre a
+# representação CSR. Abaixo dele, o custo de montar o CSR supera o ganho e a versão em Python é usada.
+# Os kernels liberam o GIL (nogil=True), então buscas disparadas de threads diferentes podem rodar em paralelo.
+CSR_MIN_VERTICES = 1024
+
+
+# Representação CSR (Compressed Sparse Row) da lista de adjacência, usada pelos kernels compilados.
+# Os vizinhos da posição i ficam em indices[indptr[i]:indptr[i + 1]].
+# Quando os rótulos são os inteiros contíguos de um range, a posição é o rótulo menos o primeiro deles,
+# e index fica como None: nenhum dicionário é montado nem consultado.
+# Quando as posições não seguem a ordem vista por quem usa o grafo (vértices, arestas e o dicionário de
+# adjacência), rank guarda a colocação de cada vértice nessa ordem: a de aparição nas arestas, em from_edges,
+# que os reorder seguintes preservam.
+class _CSR(NamedTuple):
+    indptr: np.ndarray  # Início da lista de vizinhos de cada posição (int32, tamanho n + 1).
+    indices: np.ndarray  # Posições dos vizinhos, concatenadas vértice a vértice (int32, tamanho m).
+    vertices: Union[List[any], range]  # Rótulo do vértice de cada posição.
+    index: Optional[Dict[any, int]]  # Posição de cada rótulo de vértice, ou None se vertices é um range.
+    rank: Optional[np.ndarray] = None  # Colocação de cada posição na ordem vista (int32), ou None se é a própria.
+
+    # Retorna a posição do vértice, ou None se ele não está no grafo
+    def position(self, vertex: any) -> Optional[int]:
+        if self.index is None:
+            # "in" sobre um range só é O(1) para int exato; outros tipos (como os inteiros do numpy) percorreriam
+            # o range inteiro. Por isso o rótulo é convertido com operator.index e comparado com os limites.
+            try:
+                label = operator.index(vertex)
+            except TypeError:
+                return None  # Rótulos que não são inteiros nunca estão num range
+            if self.vertices.start <= label < self.vertices.stop:
+                return label - self.vertices.start
+            return None
+        return self.index.get(vertex)
+
+    # Traduz um array de posições para a lista de rótulos correspondente
+    def labels(self, positions: np.ndarray) -> List[any]:
+        if self.index is None:
+            return (positions.astype(np.int64) + self.vertices.start).tolist()
+        return [self.vertices[i] for i in positions.tolist()]
+
+    # Retorna as posições na ordem vista por quem usa o grafo (veja rank)
+    def ordered_positions(self) -> np.ndarray:
+        if self.rank is None:
+            return np.arange(len(self.vertices), dtype=np.int32)
+        order = np.empty_like(self.rank)
+        order[self.rank] = np.arange(self.rank.shape[0], dtype=np.int32)
+        return order
+
+
+# Vetores de bits usados como conjunto de visitados pelos kernels: um bit por vértice, em palavras de 64 bits.
+# Ocupam 8 vezes menos memória que um byte por vértice, então uma linha de cache cobre 512 vértices.
+@njit(cache=True)
+def _new_bitset(size: int) -> np.ndarray:
+    return np.zeros((size + 63) >> 6, dtype=np.uint64)
+
+
+# Indica se o bit da posição i está ligado
+@njit(cache=True, inline="always")
+def _test_bit(bits: np.ndarray, i: int) -> bool:
+    return (bits[i >> 6] >> np.uint64(i & 63)) & np.uint64(1) != 0
+
+
+# Liga o bit da posição i
+@njit(cache=True, inline="always")
+def _set_bit(bits: np.ndarray, i: int) -> None:
+    bits[i >> 6] |= np.uint64(1) << np.uint64(i & 63)
+
+
+# Kernel da busca em largura sobre o CSR. Retorna as posições visitadas, na ordem de visita.
+# Se target for uma posição (>= 0), a busca para assim que ela é alcançada e o resultado termina nela.
+@njit(cache=True, nogil=True)
+def _bfs_csr(indptr: np.ndarray, indices: np.ndarray, start: int, target: int) -> np.ndarray:
+    visited = _new_bitset(indptr.shape[0] - 1)
+    # A fila é o próprio vetor de resultado: head aponta para o próximo a sair e tail para o fim.
+    queue = np.empty(indptr.shape[0] - 1, dtype=np.int32)
+    _set_bit(visited, start)
+    queue[0] = start
+    head, tail = 0, 1
+    if start == target:
+        return queue[:tail]
+
+    while head < tail:
+        vertex = queue[head]
+        head += 1
+        for k in range(indptr[vertex], indptr[vertex + 1]):
+            neighbor = indices[k]
+            if not _test_bit(visited, neighbor):
+                _set_bit(visited, neighbor)
+                queue[tail] = neighbor
+                tail += 1
+                # A fila já está na ordem de visita, então o resultado até o alvo é o que foi enfileirado
+                if neighbor == target:
+                    return queue[:tail]
+
+    return queue[:tail]
+
+
+# Parâmetros da heurística de Beamer para a busca com otimização de direção: a busca passa para pull quando as
+# arestas da fronteira superam 1/ALPHA das arestas dos vértices não visitados, e volta para push quando a
+# fronteira cai abaixo de 1/BETA dos vértices. Os valores são os recomendados no artigo original.
+_BFS_ALPHA = 14
+_BFS_BETA = 24
+
+
+# Um passo em pull da busca com otimização de direção: marca em discovered os vértices não visitados que têm
+# algum predecessor na fronteira. Cada vértice é tratado de forma independente e só escreve na própria posição
+# de visited e discovered, então o laço é dividido entre as threads do numba sem condição de corrida.
+@njit(cache=True, nogil=True, parallel=True)
+def _bfs_bottom_up_level(
+    in_indptr: np.ndarray, in_indices: np.ndarray, visited: np.ndarray, frontier: np.ndarray, discovered: np.ndarray
+) -> None:
+    for vertex in prange(visited.shape[0]):
+        if not visited[vertex]:
+            for k in range(in_indptr[vertex], in_indptr[vertex + 1]):
+                if frontier[in_indices[k]]:
+                    visited[vertex] = 1
+                    discovered[vertex] = 1
+                    break
+
+
+# Kernel da busca em largura com otimização de direção (Beamer): a cada nível, escolhe entre expandir a
+# fronteira pelas arestas de saída (push, top-down) ou fazer cada vértice não visitado procurar, entre seus
+# predecessores (in_indptr/in_indices), algum que esteja na fronteira (pull, bottom-up). A busca começa em push,
+# troca para pull quando a fronteira cresce e volta para push quando ela encolhe (veja _BFS_ALPHA e _BFS_BETA).
+# Os níveis são os mesmos da busca comum, mas num nível feito em pull os vértices aparecem em ordem de posição.
+# visited usa um byte por vértice para que o pull possa marcar vértices distintos de forma independente.
+# Assim como em _bfs_csr, um target >= 0 encerra a busca no momento em que ele é visitado.
+@njit(cache=True, nogil=True)
+def _bfs_do_csr(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    start: int,
+    target: int,
+    in_indptr: np.ndarray,
+    in_indices: np.ndarray,
+) -> np.ndarray:
+    num_vertices = indptr.shape[0] - 1
+    visited = np.zeros(num_vertices, dtype=np.uint8)
+    frontier = np.zeros(num_vertices, dtype=np.uint8)
+    discovered = np.zeros(num_vertices, dtype=np.uint8)
+    # O resultado guarda os níveis em sequência: o nível atual é order[level_start:level_end].
+    order = np.empty(num_vertices, dtype=np.int32)
+    visited[start] = 1
+    order[0] = start
+    level_start, level_end = 0, 1
+    if start == target:
+        return order[:level_end]
+    # Soma dos graus de entrada dos vértices ainda não visitados, o trabalho de um passo em pull
+    unvisited_edges = in_indices.shape[0] - (in_indptr[start + 1] - in_indptr[start])
+    pulling = False
+
+    while level_start < level_end:
+        tail = level_end
+
+        # Trabalho de um passo em push: a soma dos graus de saída da fronteira
+        frontier_edges = 0
+        for i in range(level_start, level_end):
+            frontier_edges += indptr[order[i] + 1] - indptr[order[i]]
+
+        # Troca de direção com histerese: entra em pull com uma fronteira pesada e só sai quando ela fica pequena
+        if not pulling and frontier_edges * _BFS_ALPHA > unvisited_edges:
+            pulling = True
+        elif pulling and (level_end - level_start) * _BFS_BETA < num_vertices:
+            pulling = False
+
+        if pulling:
+            # Pull: cada vértice não visitado procura um predecessor na fronteira, em paralelo
+            for i in range(level_start, level_end):
+                frontier[order[i]] = 1
+            _bfs_bottom_up_level(in_indptr, in_indices, visited, frontier, discovered)
+            for i in range(level_start, level_end):
+                frontier[order[i]] = 0
+            # Junta os vértices descobertos ao resultado em ordem de posição
+            for vertex in range(num_vertices):
+                if discovered[vertex]:
+                    discovered[vertex] = 0
+                    order[tail] = vertex
+                    tail += 1
+                    if vertex == target:
+                        return order[:tail]
+        else:
+            # Push: expande a fronteira pelas arestas de saída, como na busca comum
+            for i in range(level_start, level_end):
+                vertex = order[i]
+                for k in range(indptr[vertex], indptr[vertex + 1]):
+                    neighbor = indices[k]
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        order[tail] = neighbor
+                        tail += 1
+                        if neighbor == target:
+                            return order[:tail]
+
+        # Desconta o trabalho de pull dos vértices que acabaram de ser visitados
+        for i in range(level_end, tail):
+            unvisited_edges -= in_indptr[order[i] + 1] - in_indptr[order[i]]
+
+        level_start, level_end = level_end, tail
+
+    return order[:level_end]
+
+
+# Kernel da busca em profundidade sobre o CSR. Retorna as posições visitadas, na ordem de visita.
+# Os vizinhos são empilhados do último para o primeiro, de modo que saem da pilha na ordem do CSR e a
+# visita coincide com a da DFS recursiva.
+# Se target for uma posição (>= 0), a busca para assim que ela é visitada e o resultado termina nela.
+@njit(cache=True, nogil=True)
+def _dfs_csr(indptr: np.ndarray, indices: np.ndarray, start: int, target: int) -> np.ndarray:
+    visited = _new_bitset(indptr.shape[0] - 1)
+    path = np.empty(indptr.shape[0] - 1, dtype=np.int32)
+    # Cada vértice empilha seus vizinhos uma única vez, então a pilha nunca passa de m + 1 entradas.
+    stack = np.empty(indices.shape[0] + 1, dtype=np.int32)
+    stack[0] = start
+    top, count = 1, 0
+
+    while top > 0:
+        top -= 1
+        vertex = stack[top]
+        if not _test_bit(visited, vertex):
+            _set_bit(visited, vertex)
+            path[count] = vertex
+            count += 1
+            if vertex == target:
+                break
+            for k in range(indptr[vertex + 1] - 1, indptr[vertex] - 1, -1):
+                # Vizinhos já visitados seriam descartados ao sair da pilha, então nem são empilhados.
+                if not _test_bit(visited, indices[k]):
+                    stack[top] = indices[k]
+                    top += 1
+
+    return path[:count]
+
+
+# Kernel da detecção de ciclos em grafos direcionados sobre o CSR, com a mesma DFS iterativa de
+# Graph.__has_cycle (inclusive os valores de visited). Os não direcionados usam _has_cycle_union_find.
+@njit(cache=True, nogil=True)
+def _has_cycle_csr(indptr: np.ndarray, indices: np.ndarray) -> bool:
+    num_vertices = indptr.shape[0] - 1
+    visited = np.zeros(num_vertices, dtype=np.uint8)
+    # Pilha com o vértice e o próximo vizinho a explorar de cada nível da DFS.
+    stack = np.empty(num_vertices, dtype=np.int32)
+    cursor = np.empty(num_vertices, dtype=np.int32)
+
+    for root in range(num_vertices):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        top = 0
+        stack[0], cursor[0] = root, indptr[root]
+
+        while top >= 0:
+            vertex = stack[top]
+            k = cursor[top]
+            # Se todos os vizinhos já foram explorados, desempilha o vértice
+            if k == indptr[vertex + 1]:
+                visited[vertex] = 2
+                top -= 1
+                continue
+            cursor[top] = k + 1
+            neighbor = indices[k]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                top += 1
+                stack[top], cursor[top] = neighbor, indptr[neighbor]
+            # Há ciclo quando o vizinho ainda está na pilha (aresta de retorno)
+            elif visited[neighbor] == 1:
+                return True
+
+    return False
+
+
+# Kernel da detecção de ciclos em grafos não direcionados por Union-Find (conjuntos disjuntos).
+# Cada aresta {a, b} aparece duas vezes no CSR e é processada só uma vez, quando a <= b; se as duas
+# extremidades já estão no mesmo conjunto, a aresta fecha um ciclo. Não usa pilha nem vetor de visitados.
+@njit(cache=True, nogil=True)
+def _has_cycle_union_find(indptr: np.ndarray, indices: np.ndarray) -> bool:
+    num_vertices = indptr.shape[0] - 1
+    parent = np.arange(num_vertices, dtype=np.int32)
+    rank = np.zeros(num_vertices, dtype=np.int32)
+
+    for vertex in range(num_vertices):
+        for k in range(indptr[vertex], indptr[vertex + 1]):
+            neighbor = indices[k]
+            if neighbor < vertex:
+                continue
+
+            # Encontra a raiz de cada extremidade, encurtando o caminho pela metade (path halving)
+            a, b = vertex, neighbor
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+
+            if a == b:
+                return True
+
+            # União por posto: a árvore mais baixa passa a ser filha da mais alta
+            if rank[a] < rank[b]:
+                a, b = b, a
+            parent[b] = a
+            if rank[a] == rank[b]:
+                rank[a] += 1
+
+    return False
+
+
+# Monta o CSR diretamente a partir de um array (m, 2) de arestas, sem passar por add_edge
+def _csr_from_edges(edges: np.ndarray, directed: bool) -> _CSR:
+    flat = edges.ravel()
+    low, high = (int(flat.min()), int(flat.max())) if flat.size else (0, -1)
+    span = high - low + 1
+
+    # Se os rótulos são inteiros contíguos (todo valor entre o menor e o maior aparece), a posição de cada
+    # extremidade é o próprio rótulo deslocado, sem ordenar os rótulos nem montar um dicionário de posições
+    if span <= flat.size and np.count_nonzero(np.bincount(flat - low, minlength=span)) == span:
+        vertices, index = range(low, high + 1), None
+        positions = (edges - low).astype(np.int32)
+    # Caso contrário, obtém os rótulos distintos, já ordenados, e a posição de cada extremidade das arestas
+    else:
+        labels, positions = np.unique(flat, return_inverse=True)
+        positions = positions.reshape(-1, 2).astype(np.int32)
+        vertices = labels.tolist()
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+
+    num_vertices = len(vertices)
+
+    # As posições seguem os rótulos ordenados, mas quem usa o grafo vê os vértices na ordem em que aparecem nas
+    # arestas, como se fossem inseridos por add_edge. A primeira aparição de cada posição sai de uma atribuição
+    # em ordem reversa: com índices repetidos, o numpy mantém o último valor atribuído, que é o da primeira
+    # ocorrência. Se essa ordem já coincide com a das posições, rank fica como None.
+    occurrences = positions.ravel()
+    first = np.empty(num_vertices, dtype=np.int64)
+    first[occurrences[::-1]] = np.arange(occurrences.size - 1, -1, -1)
+    appearance = np.argsort(first, kind="stable")
+    rank = None
+    if np.any(appearance != np.arange(num_vertices)):
+        rank = np.empty(num_vertices, dtype=np.int32)
+        rank[appearance] = np.arange(num_vertices, dtype=np.int32)
+
+    # Em grafos não direcionados cada aresta também vale no sentido inverso. Intercalar (a, b) com (b, a)
+    # mantém os vizinhos de cada vértice na mesma ordem em que add_edge os inseriria.
+    if not directed:
+        positions = np.stack([positions, positions[:, ::-1]], axis=1).reshape(-1, 2)
+
+    # Remove as arestas repetidas, mantendo a primeira ocorrência de cada uma. Cada par (a, b) é codificado
+    # em um único inteiro a * n + b, bem mais barato de ordenar do que as linhas do array.
+    keys = positions[:, 0].astype(np.int64) * num_vertices + positions[:, 1]
+    _, first = np.unique(keys, return_index=True)
+    positions = positions[np.sort(first)]
+
+    # A ordenação estável pela origem agrupa os vizinhos de cada vértice sem alterar a ordem entre eles
+    order = np.argsort(positions[:, 0], kind="stable")
+    indices = np.ascontiguousarray(positions[order, 1])
+
+    # O prefixo acumulado dos graus dá o início da lista de vizinhos de cada posição
+    indptr = np.zeros(num_vertices + 1, dtype=np.int32)
+    np.cumsum(np.bincount(positions[:, 0], minlength=num_vertices), dtype=np.int32, out=indptr[1:])
+
+    return _CSR(indptr, indices, vertices, index, rank)
+
+
+# Traduz os rótulos dos vizinhos (na ordem de neighbors) para posições quando todos os rótulos são inteiros que
+# cabem em int64, sem consultar um dicionário a cada aresta. Retorna None para rótulos de outros tipos.
+def _int_label_positions(vertices: List[any], neighbors, count: int) -> Optional[np.ndarray]:
+    if not vertices or not all(type(vertex) is int for vertex in vertices):
+        return None
+    low, high = min(vertices), max(vertices)
+    if low < -(1 << 63) or high >= 1 << 63:
+        return None
+
+    labels = np.array(vertices, dtype=np.int64)
+    targets = np.fromiter(neighbors, dtype=np.int64, count=count)
+
+    # Rótulos próximos entre si (o caso comum de arquivos de arestas) cabem numa tabela indexada pelo rótulo
+    if high - low < 4 * len(vertices):
+        table = np.empty(high - low + 1, dtype=np.int32)
+        table[labels - low] = np.arange(len(vertices), dtype=np.int32)
+        return table[targets - low]
+
+    # Rótulos esparsos: busca binária sobre os rótulos ordenados
+    order = np.argsort(labels, kind="stable").astype(np.int32)
+    return order[np.searchsorted(labels[order], targets)]
+
+
+# Aplica a permutação perm às posições do CSR: a nova posição i corresponde à antiga perm[i].
+# A ordem dos vizinhos dentro de cada lista é preservada, então as buscas visitam os vértices na mesma ordem.
+def _permute_csr(csr: _CSR, perm: np.ndarray) -> _CSR:
+    num_vertices = len(perm)
+    inverse = np.empty(num_vertices, dtype=np.int32)
+    inverse[perm] = np.arange(num_vertices, dtype=np.int32)
+
+    # Os graus seguem a nova ordem, e seu prefixo acumulado dá o novo indptr
+    degrees = np.diff(csr.indptr)[perm]
+    indptr = np.zeros(num_vertices + 1, dtype=np.int32)
+    np.cumsum(degrees, dtype=np.int32, out=indptr[1:])
+
+    # Para cada entrada do novo indices, calcula de onde ela vem no antigo e renomeia o vizinho
+    rows = np.repeat(np.arange(num_vertices), degrees)
+    source = csr.indptr[perm][rows] + (np.arange(indptr[-1]) - indptr[rows])
+    indices = inverse[csr.indices[source]]
+
+    # A posição original acompanha o vértice, inclusive através de várias reordenações seguidas
+    rank = perm.astype(np.int32) if csr.rank is None else csr.rank[perm]
+
+    vertices = [csr.vertices[i] for i in perm.tolist()]
+    return _CSR(indptr, indices, vertices, {vertex: i for i, vertex in enumerate(vertices)}, rank)
 
 
 class Graph:
@@ -15,13 +425,19 @@ class Graph:
 
         Atributos
         ----------
-        graph : defaultdict(list)
-            Um dicionário para armazenar o grafo, onde as chaves são os vértices e os valores são listas de vizinhos.
+        graph : dict
+            Um dicionário para armazenar o grafo, onde as chaves são os vértices e os valores são os vizinhos,
+            guardados nas chaves de um dicionário (um conjunto que preserva a ordem de inserção).
+            Em grafos criados a partir de arestas, é montado a partir do CSR apenas quando acessado.
         directed : bool
             Indica se o grafo é direcionado ou não.
 
         Métodos
         -------
+        from_edges(edges: np.ndarray, directed: bool = False) -> Graph:
+            Cria um grafo a partir de um array (m, 2) de arestas com rótulos inteiros, montando o CSR diretamente.
+            Os demais métodos aceitam qualquer rótulo que possa ser chave de dicionário.
+
         add_edge(vertex: any, neighbor: any) -> None:
             Adiciona uma aresta entre o vértice e o vizinho.
         
@@ -37,15 +453,25 @@ class Graph:
         get_vertices() -> List[any]:
             Retorna uma lista de vértices do grafo.
         
-        bfs(vertex: any) -> List[any]:
+        bfs(vertex: any, target: any = None, *, direction_optimizing: bool = False) -> List[any]:
             Executa uma busca em largura no grafo a partir de um vértice e retorna a ordem dos vértices visitados.
+            Com target, a busca para ao alcançar esse vértice e a ordem retornada termina nele.
+            Um vértice fora do grafo não tem vizinhos, então a busca retorna apenas ele.
+            Com direction_optimizing (apenas por nome), alterna entre push e pull a cada nível, o que acelera
+            grafos densos.
         
-        dfs(vertex: any) -> List[any]:
+        dfs(vertex: any, target: any = None) -> List[any]:
             Executa uma busca em profundidade no grafo a partir de um vértice e retorna a ordem dos vértices visitados.
+            Com target, a busca para ao alcançar esse vértice e a ordem retornada termina nele.
+            Assim como em bfs, um vértice fora do grafo retorna apenas ele.
         
         has_cycle() -> bool:
             Verifica se o grafo contém ciclos e retorna True se houver, caso contrário retorna False.
         
+        reorder(method: str = "degree") -> None:
+            Reordena as posições dos vértices no CSR para melhorar a localidade de cache das buscas.
+            Os métodos disponíveis são "degree" (por grau) e "rcm" (Reverse Cuthill-McKee).
+
         get_edges(as_tuple: bool = False) -> List[Union[Tuple[any, any], List[any]]]:
             Retorna uma lista de arestas do grafo. As arestas podem ser retornadas como listas ou tuplas.
         
@@ -57,92 +483,225 @@ class Graph:
     """
     # Inicializa a classe Graph, criando um grafo vazio.
     def __init__(self, directed: bool = False) -> None:
-        self.graph = defaultdict(list)  # Usa um defaultdict para armazenar o grafo.
+        # Usa um dict simples para armazenar o grafo: um defaultdict criaria vértices vazios em cada consulta.
+        self._graph = {}
         self.directed = directed  # Indica se o grafo é direcionado ou não.
+        self._csr = None  # Cache da representação CSR, invalidado sempre que o grafo é alterado.
+        self._csr_transpose = None  # Cache do CSR das arestas de entrada, usado pela busca com otimização de direção.
+        self._vertices_cache = None  # Cache da lista de vértices, invalidado junto com o CSR.
+        self._edges_cache = {}  # Cache das listas de arestas, indexado por as_tuple.
+
+    # Cria um grafo a partir de um array (m, 2) de arestas, montando o CSR diretamente.
+    # Só aceita rótulos inteiros; para rótulos de outros tipos, use add_edge.
+    # O dicionário de adjacência só é construído se algum método precisar dele.
+    @classmethod
+    def from_edges(cls, edges: np.ndarray, directed: bool = False) -> "Graph":
+        edges = np.asarray(edges).reshape(-1, 2)
+        # Uma lista vazia vira um array de float, mas não tem rótulo algum a validar
+        if edges.size == 0:
+            edges = edges.astype(np.int64)
+        elif edges.dtype.kind not in "iu":
+            raise ValueError(f"from_edges aceita apenas rótulos inteiros, mas as arestas são do tipo {edges.dtype}")
+
+        graph = cls(directed)
+        graph._csr = _csr_from_edges(edges, directed)
+        graph._graph = None
+        return graph
+
+    # Dicionário de adjacência do grafo, reconstruído a partir do CSR quando o grafo foi criado por from_edges.
+    @property
+    def graph(self) -> dict:
+        if self._graph is None:
+            csr = self._csr
+            indptr, indices = csr.indptr.tolist(), csr.indices.tolist()
+            self._graph = {}
+            # Os vértices entram na ordem original, mesmo que o CSR tenha sido reordenado
+            for i in csr.ordered_positions().tolist():
+                self._graph[csr.vertices[i]] = dict.fromkeys(
+                    csr.vertices[j] for j in indices[indptr[i]:indptr[i + 1]]
+                )
+        return self._graph
 
     # Adiciona uma aresta entre o vértice e o vizinho.
     def add_edge(self, vertex: any, neighbor: any) -> None:
-        if neighbor not in self.graph[vertex]:
-            self.graph[vertex].append(neighbor)  # Adiciona o vizinho à lista de vértices adjacentes.
-            if not self.directed:
-                self.graph[neighbor].append(vertex)  # Se o grafo não é direcionado, adiciona a aresta reversa.
+        graph = self.graph
+        neighbors = graph.get(vertex)  # Consulta sem criar entradas, ao contrário de um defaultdict.
+
+        if neighbors is None:
+            neighbors = graph[vertex] = {}  # Registra o vértice, que ainda não aparecia no grafo.
+        elif neighbor in neighbors:
+            return  # A aresta já existe.
+
+        self.__invalidate()  # Invalida o CSR e as listas em cache.
+        neighbors[neighbor] = None  # Adiciona o vizinho ao conjunto de vértices adjacentes.
+        # Garante que o vizinho também seja registrado como vértice; se o grafo não é direcionado,
+        # adiciona a aresta reversa.
+        reverse = graph.setdefault(neighbor, {})
+        if not self.directed:
+            reverse[vertex] = None
 
     # Remove a aresta entre o vértice e o vizinho.
     def remove_edge(self, vertex: any, neighbor: any) -> None:
         if vertex in self.graph:
-            self.graph[vertex].remove(neighbor)  # Remove o vizinho da lista de vértices adjacentes.
-            if not self.directed:
-                self.graph[neighbor].remove(vertex)  # Se o grafo não é direcionado, remove a aresta reversa.
+            self.__invalidate()  # Invalida o CSR e as listas em cache.
+            del self.graph[vertex][neighbor]  # Remove o vizinho do conjunto de vértices adjacentes.
+            # Se o grafo não é direcionado, remove a aresta reversa. Um laço (vertex == neighbor) é guardado
+            # uma única vez, então já foi removido acima.
+            if not self.directed and vertex != neighbor:
+                del self.graph[neighbor][vertex]
 
     # Retorna o número de vértices no grafo.
+    # Enquanto o dicionário não foi construído (grafo criado por from_edges), as consultas leem direto do CSR.
     def get_num_vertices(self) -> int:
-        return len(self.graph.keys())
+        if self._graph is None:
+            return len(self._csr.vertices)
+        return len(self._graph)
 
     # Retorna o grau de um vértice.
     def get_degree(self, vertex: any) -> int:
-        return len(self.graph[vertex])
+        if self._graph is None:
+            position = self._csr.position(vertex)
+            return 0 if position is None else int(self._csr.indptr[position + 1] - self._csr.indptr[position])
+        return len(self._graph.get(vertex, ()))
 
     # Retorna uma lista de vértices do grafo.
+    # A lista é mantida em cache até a próxima alteração do grafo e não deve ser modificada por quem a recebe.
     def get_vertices(self) -> List[any]:
-        return list(self.graph.keys())
+        if self._vertices_cache is None:
+            if self._graph is None:
+                csr = self._csr
+                # Sem reorder, a ordem das posições já é a original
+                if csr.rank is None:
+                    self._vertices_cache = list(csr.vertices)
+                else:
+                    self._vertices_cache = csr.labels(csr.ordered_positions())
+            else:
+                self._vertices_cache = list(self._graph)
+        return self._vertices_cache
 
     # Executa uma busca em largura no grafo a partir de um vértice e retorna a ordem dos vértices visitados.
-    def bfs(self, vertex: any) -> List[any]:
-        visited, queue, result = [vertex], [vertex], []  # Inicializa as listas de visitados, fila e resultado.
+    # Com direction_optimizing, usa sempre o kernel que alterna entre push e pull (veja _bfs_do_csr).
+    # Com target, a busca para assim que o alvo é alcançado; a ordem retornada é a da busca completa até ele.
+    def bfs(self, vertex: any, target: any = None, *, direction_optimizing: bool = False) -> List[any]:
+        if direction_optimizing:
+            return self.__traverse_csr(_bfs_do_csr, vertex, target, *self.__get_csr_transpose())
+
+        if self.__use_csr():
+            return self.__traverse_csr(_bfs_csr, vertex, target)
+
+        if vertex not in self.graph:
+            return [vertex]
+
+        # O vértice inicial já é o alvo
+        if vertex == target:
+            return [vertex]
+
+        visited = {vertex}  # Conjunto de visitados, com teste de pertinência em O(1).
+        queue, result = deque([vertex]), []  # Inicializa a fila (deque) e a lista de resultado.
+
+        # Referências locais evitam a busca de atributos e métodos a cada iteração do laço
+        adj, visit, enqueue, dequeue = self.graph, visited.add, queue.append, queue.popleft
 
         while queue:
-            vertex = queue.pop(0)  # Remove e retorna o primeiro vértice da fila.
-            for neighbor in self.graph[vertex]:
+            vertex = dequeue()  # Remove e retorna o primeiro vértice da fila em O(1).
+            for neighbor in adj[vertex]:
                 if neighbor not in visited:
-                    visited.append(neighbor)  # Marca o vizinho como visitado.
-                    queue.append(neighbor)  # Adiciona o vizinho à fila.
+                    visit(neighbor)  # Marca o vizinho como visitado.
+                    enqueue(neighbor)  # Adiciona o vizinho à fila.
+                    # Ao alcançar o alvo, a fila já contém o restante da ordem de visita até ele
+                    if neighbor == target:
+                        result.append(vertex)
+                        result.extend(queue)
+                        return result
             result.append(vertex)  # Adiciona o vértice atual ao resultado.
 
         return result
 
     # Executa uma busca em profundidade no grafo a partir de um vértice e retorna a ordem dos vértices visitados.
-    def dfs(self, vertex: any) -> List[any]:
+    # Com target, a busca para assim que o alvo é visitado; a ordem retornada é a da busca completa até ele.
+    def dfs(self, vertex: any, target: any = None) -> List[any]:
+        if self.__use_csr():
+            return self.__traverse_csr(_dfs_csr, vertex, target)
+
+        if vertex not in self.graph:
+            return [vertex]
+
         stack, path = [vertex], []  # Inicializa as listas de pilha e caminho.
+        visited = set()  # Conjunto paralelo ao caminho, usado apenas para o teste de pertinência.
+
+        adj, visit, push, pop = self.graph, visited.add, stack.extend, stack.pop
 
         while stack:
-            vertex = stack.pop()  # Remove e retorna o último vértice da pilha.
-            if vertex not in path:
+            vertex = pop()  # Remove e retorna o último vértice da pilha.
+            if vertex not in visited:
+                visit(vertex)  # Marca o vértice como visitado.
                 path.append(vertex)  # Adiciona o vértice ao caminho.
-                stack.extend(self.graph[vertex])  # Adiciona os vizinhos do vértice à pilha.
+                if vertex == target:
+                    break  # O alvo foi visitado, então o restante da busca é descartado.
+                # Adiciona à pilha apenas os vizinhos ainda não visitados, já que os demais seriam descartados
+                # ao sair dela. Isso mantém a pilha bem menor que o número de arestas. Eles entram em ordem
+                # reversa para saírem na ordem de adjacência, visitando os vértices como a DFS recursiva.
+                push(neighbor for neighbor in reversed(adj[vertex]) if neighbor not in visited)
 
         return path
 
     # Método para verificar se o grafo possui ciclos
     def has_cycle(self) -> bool:
-        # Obtém o número de vértices do grafo
-        num_vertices = self.get_num_vertices()
-        # Inicializa a lista de vértices visitados com todos como False
-        visited = [False] * (num_vertices + 1)
+        if self.__use_csr():
+            csr = self.__get_csr()
+            # Em grafos não direcionados, o Union-Find percorre cada aresta uma vez, sem pilha de busca
+            if not self.directed:
+                return bool(_has_cycle_union_find(csr.indptr, csr.indices))
+            return bool(_has_cycle_csr(csr.indptr, csr.indices))
+
+        # Obtém os vértices do grafo e associa cada um a uma posição contígua,
+        # pois os rótulos dos vértices podem ser esparsos ou não começar em zero
+        vertices = self.get_vertices()
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+        # Inicializa o vetor de visitados com um byte por vértice, todos zerados
+        visited = bytearray(len(vertices))
 
         # Itera pelos vértices do grafo
-        for vertex in range(num_vertices):
+        for vertex in vertices:
             # Se o vértice não foi visitado
-            if not visited[vertex]:
+            if not visited[index[vertex]]:
                 # Chama a função auxiliar __has_cycle e verifica se há ciclo
-                if self.__has_cycle(vertex, visited, -1):
+                if self.__has_cycle(vertex, visited, index):
                     return True
 
         # Se não encontrou ciclo, retorna False
         return False
     
     # Método auxiliar para verificar se há ciclos no grafo
-    def __has_cycle(self, vertex: any, visited: List[bool], parent: any) -> bool:
-        # Marca o vértice atual como visitado
-        visited[vertex] = True
+    # Usa uma DFS iterativa com pilha explícita, evitando o custo de chamadas recursivas e o RecursionError.
+    # visited vale 1 enquanto o vértice está na pilha e 2 depois que todos os seus vizinhos foram explorados.
+    def __has_cycle(self, vertex: any, visited: bytearray, index: Dict[any, int]) -> bool:
+        # Marca o vértice inicial como visitado
+        visited[index[vertex]] = 1
 
-        # Itera pelos vizinhos do vértice atual
-        for neighbor in self.graph[vertex]:
-            # Se o vizinho não foi visitado
-            if not visited[neighbor]:
-                # Chama recursivamente a função __has_cycle e verifica se há ciclo
-                if self.__has_cycle(neighbor, visited, vertex):
+        adj, directed = self.graph, self.directed
+
+        # Cada entrada da pilha guarda o vértice, seu pai e um iterador sobre os vizinhos ainda não explorados.
+        # O vértice inicial não tem pai, o que é representado por None.
+        stack = [(vertex, None, iter(adj[vertex]))]
+
+        while stack:
+            vertex, parent, neighbors = stack[-1]
+            neighbor = next(neighbors, None)
+
+            # Se todos os vizinhos já foram explorados, desempilha o vértice
+            if neighbor is None:
+                visited[index[vertex]] = 2
+                stack.pop()
+            # Se o vizinho não foi visitado, marca e empilha para explorar seus vizinhos
+            elif not visited[index[neighbor]]:
+                visited[index[neighbor]] = 1
+                stack.append((neighbor, vertex, iter(adj[neighbor])))
+            # Em grafos direcionados, há ciclo quando o vizinho ainda está na pilha (aresta de retorno)
+            elif directed:
+                if visited[index[neighbor]] == 1:
                     return True
-            # Se o vizinho já foi visitado e não é o vértice pai
+            # Em grafos não direcionados, basta o vizinho já ter sido visitado e não ser o vértice pai
             elif parent != neighbor:
                 return True
 
@@ -150,50 +709,181 @@ class Graph:
         return False
 
 
+    # Método auxiliar que descarta o CSR e as listas de vértices e arestas em cache após uma alteração no grafo
+    def __invalidate(self) -> None:
+        self._csr = None
+        self._csr_transpose = None
+        self._vertices_cache = None
+        self._edges_cache = {}
+
+    # Método auxiliar que indica se as buscas devem usar os kernels sobre o CSR: sempre que ele já existe
+    # (por exemplo, em grafos lidos de arquivo) ou quando o grafo é grande o bastante para compensar montá-lo
+    def __use_csr(self) -> bool:
+        return self._csr is not None or len(self._graph) >= CSR_MIN_VERTICES
+
+    # Método auxiliar que monta (ou reaproveita do cache) a representação CSR do grafo
+    def __get_csr(self) -> _CSR:
+        if self._csr is None:
+            adj = self.graph
+            vertices = list(adj)
+            index = {vertex: i for i, vertex in enumerate(vertices)}
+
+            # O prefixo acumulado dos graus dá o início da lista de vizinhos de cada posição
+            indptr = np.zeros(len(vertices) + 1, dtype=np.int32)
+            np.cumsum([len(neighbors) for neighbors in adj.values()], dtype=np.int32, out=indptr[1:])
+
+            # Concatena as posições dos vizinhos, vértice a vértice. Com rótulos inteiros a tradução é vetorizada;
+            # nos demais casos, cada vizinho é consultado no dicionário de posições.
+            count = int(indptr[-1])
+            indices = _int_label_positions(vertices, chain.from_iterable(adj.values()), count)
+            if indices is None:
+                indices = np.fromiter(
+                    map(index.__getitem__, chain.from_iterable(adj.values())), dtype=np.int32, count=count
+                )
+
+            self._csr = _CSR(indptr, indices, vertices, index)
+
+        return self._csr
+
+    # Método auxiliar que executa um kernel de busca sobre o CSR e traduz as posições de volta para rótulos
+    # Argumentos extras são repassados ao kernel depois das posições inicial e do alvo.
+    def __traverse_csr(self, kernel, vertex: any, target: any, *args: np.ndarray) -> List[any]:
+        csr = self.__get_csr()
+
+        # Um vértice fora do grafo não tem vizinhos, então a busca visita apenas ele mesmo
+        start = csr.position(vertex)
+        if start is None:
+            return [vertex]
+
+        # Um alvo nulo ou fora do grafo nunca é alcançado, e o kernel recebe -1 para seguir até o fim
+        position = None if target is None else csr.position(target)
+        return csr.labels(kernel(csr.indptr, csr.indices, start, -1 if position is None else position, *args))
+
+    # Método auxiliar que retorna as posições no CSR da origem e do destino de cada aresta, na ordem original
+    # dos vértices. Em grafos não direcionados, cada aresta aparece nas duas linhas; fica apenas a da origem que
+    # vem primeiro nessa ordem.
+    def __get_edge_positions(self) -> Tuple[np.ndarray, np.ndarray]:
+        csr = self.__get_csr()
+        sources = np.repeat(np.arange(len(csr.vertices), dtype=np.int32), np.diff(csr.indptr))
+        targets = csr.indices
+        if csr.rank is None:
+            first, second = sources, targets
+        else:
+            # Depois de um reorder, as linhas voltam para a ordem original, preservando a ordem de cada lista
+            order = np.argsort(csr.rank[sources], kind="stable")
+            sources, targets = sources[order], targets[order]
+            first, second = csr.rank[sources], csr.rank[targets]
+        if not self.directed:
+            mask = first <= second
+            sources, targets = sources[mask], targets[mask]
+        return sources, targets
+
+    # Método auxiliar que retorna o indptr e o indices das arestas de entrada de cada posição.
+    # Em grafos não direcionados eles coincidem com os de saída; nos direcionados, o CSR é transposto e guardado.
+    def __get_csr_transpose(self) -> Tuple[np.ndarray, np.ndarray]:
+        csr = self.__get_csr()
+        if not self.directed:
+            return csr.indptr, csr.indices
+
+        if self._csr_transpose is None:
+            num_vertices = len(csr.vertices)
+            # Origem de cada aresta, ordenada de forma estável pelo destino
+            sources = np.repeat(np.arange(num_vertices, dtype=np.int32), np.diff(csr.indptr))
+            in_indices = sources[np.argsort(csr.indices, kind="stable")]
+            in_indptr = np.zeros(num_vertices + 1, dtype=np.int32)
+            np.cumsum(np.bincount(csr.indices, minlength=num_vertices), dtype=np.int32, out=in_indptr[1:])
+            self._csr_transpose = (in_indptr, in_indices)
+
+        return self._csr_transpose
+
+    # Método para reordenar as posições dos vértices no CSR, melhorando a localidade de cache das buscas.
+    # Com "degree", os vértices de maior grau (os mais acessados) ficam juntos no início dos vetores.
+    # Com "rcm" (Reverse Cuthill-McKee), vizinhos recebem posições próximas, o que aproxima as linhas lidas
+    # em sequência pelas buscas.
+    # Os rótulos, a ordem dos vértices e das arestas e os resultados das buscas não mudam, a não ser a ordem
+    # dentro de um nível feito em pull na busca com otimização de direção, que segue as posições.
+    def reorder(self, method: str = "degree") -> None:
+        csr = self.__get_csr()
+
+        if method == "degree":
+            perm = np.argsort(-np.diff(csr.indptr), kind="stable")
+        elif method == "rcm":
+            # O scipy só é importado aqui, já que é usado apenas por esta reordenação
+            from scipy.sparse import csr_matrix
+            from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+            num_vertices = len(csr.vertices)
+            if csr.indices.shape[0] == 0:
+                perm = np.arange(num_vertices)  # Sem arestas não há vizinhos a aproximar, e o scipy falharia
+            else:
+                weights = np.ones(csr.indices.shape[0], dtype=np.int8)
+                matrix = csr_matrix((weights, csr.indices, csr.indptr), shape=(num_vertices, num_vertices))
+                # Em grafos direcionados a matriz não é simétrica, e o scipy considera as arestas nos dois sentidos
+                perm = reverse_cuthill_mckee(matrix, symmetric_mode=not self.directed)
+        else:
+            raise ValueError(f"Método de reordenação desconhecido: {method}")
+
+        self._csr = _permute_csr(csr, perm)
+        self._csr_transpose = None
+
     # Método para obter as arestas do grafo
+    # A lista é mantida em cache até a próxima alteração do grafo e não deve ser modificada por quem a recebe.
     def get_edges(self, as_tuple: bool = False) -> List[Union[Tuple[any, any], List[any]]]:
-        result = []  # Inicializa a lista de resultado
-        processed_edges = set()  # Cria um conjunto para armazenar arestas processadas
+        # Reaproveita a lista já calculada, se o grafo não mudou desde então
+        if as_tuple in self._edges_cache:
+            return self._edges_cache[as_tuple]
 
-        # Itera pelos vértices do grafo
-        for vertex in self.get_vertices():
-            # Itera pelos vizinhos do vértice atual
-            for neighbor in self.graph[vertex]:
-                # Cria uma tupla com os vértices da aresta, ordenada de forma crescente
-                edge = (vertex, neighbor) if vertex < neighbor else (neighbor, vertex)
-
-                # Se o grafo não é direcionado e a aresta já foi processada, continua
-                if not self.directed and edge in processed_edges:
-                    continue
-
-                # Adiciona a aresta ao conjunto de arestas processadas
-                processed_edges.add(edge)
-
-                # Adiciona a aresta ao resultado
-                if as_tuple:
-                    result.append(edge)
-                else:
-                    result.append([vertex, neighbor])
+        # Grafo criado por from_edges: as arestas saem direto do CSR, sem construir o dicionário
+        if self._graph is None:
+            # Cada aresta não direcionada sai do vértice que vem primeiro, o primeiro a ser percorrido,
+            # como no laço sobre o dicionário abaixo
+            sources, targets = self.__get_edge_positions()
+            result = list(zip(self._csr.labels(sources), self._csr.labels(targets)))
+        elif self.directed:
+            # Em grafos direcionados cada aresta aparece uma única vez, então não há o que deduplicar
+            result = [(vertex, neighbor) for vertex, neighbors in self.graph.items() for neighbor in neighbors]
+        else:
+            result = []  # Inicializa a lista de resultado
+            # Vértices cujas arestas já foram todas listadas. Uma aresta até um deles já está no resultado,
+            # então basta guardar os vértices (e não as arestas), sem precisar comparar os rótulos.
+            processed_vertices = set()
+
+            # Itera pelos vértices do grafo
+            for vertex, neighbors in self.graph.items():
+                # Adiciona as arestas até os vizinhos que ainda não foram processados
+                for neighbor in neighbors:
+                    if neighbor not in processed_vertices:
+                        result.append((vertex, neighbor))
+                processed_vertices.add(vertex)
 
-        # Retorna a lista de arestas
+        # As arestas são montadas como tuplas e convertidas para listas quando necessário
+        if not as_tuple:
+            result = [list(edge) for edge in result]
+
+        # Guarda e retorna a lista de arestas
+        self._edges_cache[as_tuple] = result
         return result
 
     # Método para representar o grafo como uma string
     def __str__(self) -> str:
         # Obtém a lista de vértices e arestas como strings
-        vertices_str = ", ".join(map(str, self.get_vertices()))
-        edges_str = ", ".join([f"({v1}, {v2})" for v1, v2 in self.get_edges(as_tuple=True)])
+        vertices, edges = self.get_vertices(), self.get_edges(as_tuple=True)
+        vertices_str = ", ".join(map(str, vertices))
+        edges_str = ", ".join([f"({v1}, {v2})" for v1, v2 in edges])
 
-        # Retorna a representação do grafo como uma string
-        return f"Vertices: {vertices_str}\nNumber of Vertices: {self.get_num_vertices()}\nEdges: {edges_str}\nNumber of Edges: {len(self.get_edges())}"
+        # Retorna a representação do grafo como uma string, reaproveitando as listas para as contagens
+        return f"Vertices: {vertices_str}\nNumber of Vertices: {len(vertices)}\nEdges: {edges_str}\nNumber of Edges: {len(edges)}"
 
 
      # Método para exibir o grafo em um mapa 2D
     def show_2d_map(self) -> None:
+        # As bibliotecas de visualização só são importadas aqui, para não pesar em quem usa apenas os algoritmos
+        from pyvis import network as net
+        from IPython.display import display, HTML
+        import minify_html
+
         # Obtém os vértices e arestas do grafo
         vertices, edges = self.get_vertices(), self.get_edges()
-        print(vertices)
-        print(edges)
 
         # Cria a interface para o grafo 2D
         interface = net.Network(
@@ -213,45 +903,43 @@ class Graph:
         # Exibe o grafo 2D em um arquivo HTML
         output_file = '2DGraph.html'
         interface.show(output_file)
-        display(HTML(output_file))
+
+        # Minifica o HTML gerado pelo pyvis (espaços, CSS e JS embutidos) antes de enviá-lo ao notebook
+        with open(output_file, encoding='utf-8') as file:
+            html = minify_html.minify(file.read(), minify_js=True, minify_css=True)
+        with open(output_file, 'w', encoding='utf-8') as file:
+            file.write(html)
+        display(HTML(html))
 
 
 
     # Método para exibir o grafo em um mapa 3D
     def show_3d_map(self) -> None:
-        # Obtém o número de vértices do grafo
-        num_vertices = self.get_num_vertices()
-        edges_weights = [1] * num_vertices
-        edges = self.get_edges(as_tuple=True)
-
-        # Cria o grafo 3D com coordenadas aleatórias para cada vértice
-        graph_3d = {
-            v: [random.random(), random.random(), random.random()] for v in self.get_vertices()
-        }
+        import plotly.graph_objects as go
 
-        # Obtém as coordenadas dos vértices
-        x_vertices = [graph_3d[key][0] for key in graph_3d.keys()]
-        y_vertices = [graph_3d[key][1] for key in graph_3d.keys()]
-        z_vertices = [graph_3d[key][2] for key in graph_3d.keys()]
+        # Obtém as extremidades de cada aresta como posições do CSR, o mesmo usado pelas buscas, então nem os
+        # rótulos nem um dicionário de posições precisam ser montados. Cada vértice ocupa a linha da sua posição.
+        src, dst = self.__get_edge_positions()
+        num_vertices, num_edges = len(self._csr.vertices), len(src)
+        edges_weights = [1] * num_edges  # Um peso por aresta
 
-        # Inicializa as listas para armazenar as coordenadas das arestas e seus pontos médios
-        x_edges, y_edges, z_edges = [], [], []
-        xtp, ytp, ztp = [], [], []
+        # Cria o grafo 3D com coordenadas aleatórias para cada vértice, uma linha por vértice.
+        # Precisão simples basta para posicionar os pontos e reduz à metade os dados enviados ao plotly.
+        coords = np.random.default_rng().random((num_vertices, 3), dtype=np.float32)
 
-        # Itera pelas arestas do grafo
-        for edge in edges:
-            # Adiciona as coordenadas das arestas e seus pontos médios às listas
-            x_coords = [graph_3d[edge[0]][0], graph_3d[edge[1]][0], None]
-            x_edges.extend(x_coords)
-            xtp.append(0.5 * (graph_3d[edge[0]][0] + graph_3d[edge[1]][0]))
+        # Obtém as coordenadas dos vértices
+        x_vertices, y_vertices, z_vertices = coords.T
 
-            y_coords = [graph_3d[edge[0]][1], graph_3d[edge[1]][1], None]
-            y_edges.extend(y_coords)
-            ytp.append(0.5 * (graph_3d[edge[0]][1] + graph_3d[edge[1]][1]))
+        # Monta os segmentos das arestas como (origem, destino, NaN); o NaN interrompe a linha entre arestas.
+        # Cada parte é escrita direto na sua faixa de linhas do vetor final, sem arrays intermediários.
+        segments = np.empty((3 * num_edges, 3), dtype=np.float32)
+        segments[0::3] = coords[src]
+        segments[1::3] = coords[dst]
+        segments[2::3] = np.nan
+        x_edges, y_edges, z_edges = segments.T
 
-            z_coords = [graph_3d[edge[0]][2], graph_3d[edge[1]][2], None]
-            z_edges.extend(z_coords)
-            ztp.append(0.5 * (graph_3d[edge[0]][2] + graph_3d[edge[1]][2]))
+        # Calcula os pontos médios das arestas, onde ficam os textos de peso
+        xtp, ytp, ztp = (0.5 * (coords[src] + coords[dst])).T
 
         # Cria uma lista de textos para exibir os pesos das arestas
         etext = [f'weight={w}' for w in edges_weights]
@@ -310,26 +998,29 @@ class Graph:
 
 # Função para criar um objeto Graph a partir de um arquivo
 def graph_from_file(file_path: str = "", separator: str = " ", directed: bool = False) -> Graph:
-    # Cria uma instância da classe Graph, com a opção de ser direcionado ou não
-    graph = Graph(directed)
-    
-    # Função lambda para dividir uma string usando o separador fornecido e converter cada parte em inteiro
-    split = lambda string: [*map(int, string.split(separator))]
+    # Um separador de espaços em branco vira None, que divide em qualquer sequência de espaços ou tabulações,
+    # como str.split() sem argumentos; assim espaços repetidos não geram campos vazios
+    delimiter = None if separator.isspace() else separator
 
     # Abre o arquivo no caminho especificado e lê o conteúdo
     with open(file_path, "r") as file:
-        # Itera sobre cada linha do arquivo
-        for line in file.readlines():
-            # Usa a função lambda para dividir a linha em partes e obter a lista de vértices como inteiros
-            edge = split(line)
-            
-            # Verifica se a linha possui pelo menos dois elementos (dois vértices para formar uma aresta)
-            if len(edge) > 1:
-                # Extrai os dois vértices da linha
-                a, b = edge
-                
-                # Adiciona a aresta entre os vértices 'a' e 'b' no objeto graph
-                graph.add_edge(a, b)
-
-    # Retorna o objeto graph criado a partir do arquivo
-    return graph
+        # Só as linhas com pelo menos dois elementos (dois vértices para formar uma aresta) são lidas. As demais,
+        # como a primeira linha de grafo.txt, que traz apenas o número de arestas, são puladas.
+        if delimiter is None:
+            lines = (line for line in file if len(line.split(None, 1)) > 1)
+        elif len(delimiter) > 1:
+            # O loadtxt só aceita delimitadores de um caractere; separadores maiores (como ", " ou "->") são
+            # trocados por vírgula em cada linha, o que dá a mesma divisão de str.split(separator)
+            lines = (line.replace(separator, ",") for line in file if separator in line)
+            delimiter = ","
+        else:
+            lines = (line for line in file if delimiter in line)
+
+        # Converte as linhas para um array (m, 2) com os vértices de cada aresta, sem carregar o arquivo inteiro
+        # na memória. Um arquivo sem arestas gera um aviso do numpy, que é silenciado: o grafo fica vazio.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            edges = np.loadtxt(lines, dtype=np.int64, delimiter=delimiter, usecols=(0, 1), ndmin=2)
+
+    # Cria e retorna o objeto Graph a partir das arestas lidas, com a opção de ser direcionado ou não
+    return Graph.from_edges(edges, directed)
@@ -0,0 +1,243 @@
+import os
+import random
+import tempfile
+import unittest
+import warnings
+from unittest import mock
+
+import numpy as np
+
+import Grafo
+from Grafo import Graph, graph_from_file
+
+try:
+    import scipy  # noqa: F401
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+
+# Gera um grafo aleatório pequeno como lista de arestas, com rótulos esparsos em parte dos casos
+def random_edges(rng: random.Random) -> list:
+    n = rng.randint(1, 30)
+    scale = rng.choice([1, 1, 7])
+    return [(rng.randint(0, n) * scale, rng.randint(0, n)) for _ in range(rng.randint(1, 60))]
+
+
+# Monta o grafo com add_edge, como faria quem usa a classe
+def build(edges: list, directed: bool) -> Graph:
+    graph = Graph(directed)
+    for a, b in edges:
+        graph.add_edge(a, b)
+    return graph
+
+
+# Busca em profundidade recursiva, referência para a ordem de dfs
+def recursive_dfs(graph: Graph, start: any) -> list:
+    visited, order = set(), []
+
+    def visit(vertex):
+        visited.add(vertex)
+        order.append(vertex)
+        for neighbor in graph.graph[vertex]:
+            if neighbor not in visited:
+                visit(neighbor)
+
+    visit(start)
+    return order
+
+
+# Referência para has_cycle: Union-Find nas arestas distintas (não direcionado) ou cores na DFS (direcionado)
+def reference_has_cycle(edges: list, directed: bool) -> bool:
+    if not directed:
+        parent = {}
+
+        def find(x):
+            parent.setdefault(x, x)
+            while parent[x] != x:
+                x = parent[x]
+            return x
+
+        for edge in {frozenset(edge) for edge in edges}:
+            a, b = (tuple(edge) * 2)[:2]
+            if find(a) == find(b):
+                return True
+            parent[find(a)] = find(b)
+        return False
+
+    adj = {}
+    for a, b in edges:
+        adj.setdefault(a, set()).add(b)
+        adj.setdefault(b, set())
+    color = dict.fromkeys(adj, 0)
+
+    def visit(vertex):
+        color[vertex] = 1
+        for neighbor in adj[vertex]:
+            if color[neighbor] == 1 or (color[neighbor] == 0 and visit(neighbor)):
+                return True
+        color[vertex] = 2
+        return False
+
+    return any(color[vertex] == 0 and visit(vertex) for vertex in adj)
+
+
+# Escreve o conteúdo num arquivo temporário e carrega o grafo com graph_from_file
+def load(content: str, separator: str = " ", directed: bool = False) -> Graph:
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as file:
+        file.write(content)
+    try:
+        return graph_from_file(file.name, separator=separator, directed=directed)
+    finally:
+        os.remove(file.name)
+
+
+class TestCSRMatchesPython(unittest.TestCase):
+    # Compara os kernels sobre o CSR (montado do dicionário, por from_edges e depois de reorder) com a versão
+    # em Python, que é usada abaixo de CSR_MIN_VERTICES
+    def test_traversals_and_queries(self):
+        rng = random.Random(0)
+        methods = ["degree", "rcm"] if HAS_SCIPY else ["degree"]
+
+        for _ in range(150):
+            edges, directed = random_edges(rng), rng.random() < 0.5
+            reference = build(edges, directed)
+            vertices = reference.get_vertices()
+            starts = vertices[:4]
+            targets = rng.sample(vertices, min(3, len(vertices))) + [-1]
+
+            csr_from_dict = build(edges, directed)
+            from_edges = Graph.from_edges(edges, directed)
+            reordered = Graph.from_edges(edges, directed)
+            reordered.reorder(rng.choice(methods))
+            reordered_dict = build(edges, directed)
+            reordered_dict.reorder(rng.choice(methods))
+
+            with mock.patch.object(Grafo, "CSR_MIN_VERTICES", 0):
+                for graph in (csr_from_dict, from_edges, reordered, reordered_dict):
+                    self.assertEqual(graph.get_vertices(), vertices)
+                    self.assertEqual(graph.get_edges(), reference.get_edges())
+                    self.assertEqual(graph.get_edges(as_tuple=True), reference.get_edges(as_tuple=True))
+                    self.assertEqual(graph.has_cycle(), reference.has_cycle())
+                    for start in starts:
+                        self.assertEqual(graph.get_degree(start), reference.get_degree(start))
+                        self.assertEqual(graph.bfs(start), reference.bfs(start))
+                        self.assertEqual(graph.dfs(start), reference.dfs(start))
+                        for target in targets:
+                            self.assertEqual(graph.bfs(start, target), reference.bfs(start, target))
+                            self.assertEqual(graph.dfs(start, target), reference.dfs(start, target))
+
+    # A busca com otimização de direção visita os mesmos vértices, nível a nível
+    def test_direction_optimizing_bfs_levels(self):
+        rng = random.Random(1)
+
+        for _ in range(150):
+            edges, directed = random_edges(rng), rng.random() < 0.5
+            graph = build(edges, directed)
+            for start in graph.get_vertices()[:4]:
+                distance = {start: 0}
+                for vertex in graph.bfs(start):
+                    for neighbor in graph.graph[vertex]:
+                        distance.setdefault(neighbor, distance[vertex] + 1)
+
+                order = graph.bfs(start, direction_optimizing=True)
+                self.assertEqual(order[0], start)
+                self.assertEqual(sorted(order, key=repr), sorted(distance, key=repr))
+                levels = [distance[vertex] for vertex in order]
+                self.assertEqual(levels, sorted(levels))
+
+    # Confere os resultados contra referências independentes da implementação
+    def test_against_references(self):
+        rng = random.Random(2)
+
+        for _ in range(200):
+            edges, directed = random_edges(rng), rng.random() < 0.5
+            for use_csr in (False, True):
+                graph = build(edges, directed)
+                with mock.patch.object(Grafo, "CSR_MIN_VERTICES", 0 if use_csr else Grafo.CSR_MIN_VERTICES):
+                    self.assertEqual(graph.has_cycle(), reference_has_cycle(edges, directed), edges)
+                    start = edges[0][0]
+                    self.assertEqual(graph.dfs(start), recursive_dfs(graph, start))
+
+
+class TestRegressions(unittest.TestCase):
+    # reorder não muda a ordem dos vértices nem das arestas, mesmo sem o dicionário construído
+    def test_reorder_keeps_order(self):
+        edges = [[1, 2], [2, 3], [3, 4], [4, 5], [2, 5], [1, 3]]
+        expected = Graph.from_edges(edges)
+        graph = Graph.from_edges(edges)
+        graph.reorder()
+        self.assertEqual(graph.get_vertices(), [1, 2, 3, 4, 5])
+        self.assertEqual(graph.get_edges(as_tuple=True), expected.get_edges(as_tuple=True))
+        self.assertEqual(list(graph.graph), [1, 2, 3, 4, 5])
+
+        # O resultado não depende de as listas terem sido consultadas antes da reordenação
+        queried = Graph.from_edges(edges)
+        queried.get_vertices()
+        queried.reorder()
+        self.assertEqual(list(queried.graph), queried.get_vertices())
+
+    # Duas arestas chegando ao mesmo vértice não formam um ciclo num grafo direcionado
+    def test_directed_cycle_needs_back_edge(self):
+        for use_csr in (False, True):
+            with mock.patch.object(Grafo, "CSR_MIN_VERTICES", 0 if use_csr else Grafo.CSR_MIN_VERTICES):
+                self.assertFalse(build([(1, 3), (2, 3)], True).has_cycle())
+                self.assertFalse(build([(2, 3), (1, 3), (1, 2)], True).has_cycle())
+                self.assertTrue(build([(1, 2), (2, 3), (3, 1)], True).has_cycle())
+
+    # Remover um laço num grafo não direcionado não tenta remover a aresta reversa
+    def test_remove_undirected_self_loop(self):
+        graph = build([(1, 1), (1, 2)], False)
+        graph.remove_edge(1, 1)
+        self.assertEqual(graph.get_edges(), [[1, 2]])
+
+    # Rótulos de outros tipos são procurados no range de posições sem percorrê-lo
+    def test_range_position_lookup(self):
+        graph = Graph.from_edges(np.array([[0, 1], [1, 2]]))
+        self.assertEqual(graph.get_degree(np.int64(1)), 2)
+        self.assertEqual(graph.get_degree("x"), 0)
+        self.assertEqual(graph.get_degree(3.5), 0)
+        self.assertEqual(graph.bfs(np.int64(0)), [0, 1, 2])
+        self.assertEqual(graph.bfs("x"), ["x"])
+
+    # Linhas com menos de dois elementos são puladas em qualquer ponto do arquivo
+    def test_file_short_lines(self):
+        self.assertEqual(load("1 2\n3\n4 5\n").get_edges(as_tuple=True), [(1, 2), (4, 5)])
+        self.assertEqual(load("6\n1,2\n2,3\n", separator=",").get_edges(as_tuple=True), [(1, 2), (2, 3)])
+
+    # Arquivos vazios ou só com o cabeçalho geram um grafo vazio, sem avisos
+    def test_file_without_edges(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertEqual(load("").get_vertices(), [])
+            self.assertEqual(load("3\n").get_vertices(), [])
+
+    # Separadores com mais de um caractere dividem as linhas como str.split
+    def test_file_multi_character_separator(self):
+        self.assertEqual(load("1, 2\n2, 3\n", separator=", ").get_edges(as_tuple=True), [(1, 2), (2, 3)])
+        self.assertEqual(load("1->2\n2->3\n", separator="->").get_edges(as_tuple=True), [(1, 2), (2, 3)])
+
+    # Os vértices de um arquivo aparecem na ordem em que surgem nas arestas, como em add_edge
+    def test_file_first_appearance_order(self):
+        graph = load("5 1\n1 2\n")
+        self.assertEqual(graph.get_vertices(), [5, 1, 2])
+        self.assertEqual(graph.get_edges(), [[5, 1], [1, 2]])
+        self.assertEqual(list(graph.graph), [5, 1, 2])
+
+    # from_edges aceita apenas rótulos inteiros
+    def test_from_edges_rejects_non_integer_labels(self):
+        with self.assertRaises(ValueError):
+            Graph.from_edges([["a", "b"]])
+        with self.assertRaises(ValueError):
+            Graph.from_edges([[1.0, 2.0]])
+        self.assertEqual(Graph.from_edges([]).get_vertices(), [])
+
+    # O segundo argumento posicional de bfs e dfs é o alvo
+    def test_positional_target(self):
+        graph = Graph.from_edges([[1, 2], [1, 5], [2, 3], [3, 4], [5, 4]])
+        self.assertEqual(graph.bfs(1, 3), [1, 2, 5, 3])
+        self.assertEqual(graph.dfs(1, 3), [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()